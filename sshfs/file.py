@@ -53,12 +53,13 @@ class SSHFile(io.IOBase):
 
     @wrap_exceptions
     async def _open_file(self):
-        # TODO: this needs to keep a reference to the
-        # pool as well, otherwise we might broke our
-        # guarantee for the hard pool since the file
-        # will still be using that channel to perform
-        # it's operations but the pool it thinking this
-        # channel is freed.
+        # The channel is only checked out while the file is being
+        # opened, so long-lived handles never starve the pool. The
+        # downside is that the hard pool's guarantee doesn't cover
+        # the file's operations, since the pool considers the channel
+        # to be freed while the file still uses it. Re-opening the file
+        # for every operation would keep the guarantee, but it would cost
+        # an extra round-trip each time.
         async with self.fs._pool.get() as channel:
             return await channel.open(
                 self.path,
@@ -95,6 +96,8 @@ class SSHFile(io.IOBase):
 
         self._close()
         self._closed = True
+        if self.writable():
+            self.fs.invalidate_cache(self.path)
 
     def __enter__(self):
         return self
@@ -1,5 +1,4 @@
-import asyncio
-from contextlib import AsyncExitStack, suppress
+from contextlib import AsyncExitStack, asynccontextmanager, suppress
 
 from asyncssh.misc import ChannelOpenError
 
@@ -43,7 +42,7 @@ class BaseSFTPChannelPool:
         # try to create a new channel
         if (
             self.max_channels is None
-            or self.active_channels < self.max_channels
+            or self._open_channels < self.max_channels
         ):
             try:
                 return await self._stack.enter_async_context(
@@ -53,11 +52,30 @@ class BaseSFTPChannelPool:
                 # If we can't create any more channels, then change
                 # the hard limit to reflect that so that we don't hit
                 # these errors again.
-                self.max_channels = self.active_channels
+                self.max_channels = self._open_channels
 
-    async def get(self):
+    @property
+    def _open_channels(self):
+        # Number of the channels that this pool has opened, regardless
+        # of whether they are currently in use or not.
+        return self.active_channels
+
+    async def acquire(self):
+        """Check out a channel from the pool. Each acquired channel must
+        be given back to the pool with ``.release()``."""
+        raise NotImplementedError
+
+    def release(self, channel):
         raise NotImplementedError
 
+    @asynccontextmanager
+    async def get(self):
+        channel = await self.acquire()
+        try:
+            yield channel
+        finally:
+            self.release(channel)
+
     async def _cleanup(self):
         ...
 
@@ -67,8 +85,7 @@ class BaseSFTPChannelPool:
                 f"{type(self).__name__!r} can't be closed while there are active channels"
             )
 
-        async with asyncio.Lock():
-            with suppress(Exception):
-                await self._cleanup()
+        with suppress(Exception):
+            await self._cleanup()
 
-            await self._stack.aclose()
+        await self._stack.aclose()
@@ -1,5 +1,6 @@
 import asyncio
-from contextlib import asynccontextmanager
+from collections import deque
+from contextlib import suppress
 
 from sshfs.pools.base import BaseSFTPChannelPool
 
@@ -12,35 +13,76 @@ class SFTPHardChannelPool(BaseSFTPChannelPool):
     seconds until a ``TimeoutError`` is raised)."""
 
     def __init__(self, *args, **kwargs):
-        self._queue = asyncio.Queue(0)
+        self._idle = deque()
+        self._waiters = deque()
         self._poll = kwargs.pop("poll", True)
-        self.active_channels = 0
+        self._num_channels = 0
         super().__init__(*args, **kwargs)
 
-    @asynccontextmanager
-    async def get(self):
+    async def acquire(self):
         channel = None
-        if self._queue.empty():
+        if self._idle:
+            channel = self._idle.popleft()
+        else:
             channel = await self._maybe_new_channel()
+            if channel is None and self._idle:
+                # A channel might get released while we were trying
+                # to open a new one.
+                channel = self._idle.popleft()
 
         if channel is None:
-            if self._queue.qsize() == 0 and not self.active_channels:
+            if not self.active_channels:
                 raise ValueError("Can't create any SFTP connections!")
 
             if self._poll:
-                channel = await asyncio.wait_for(
-                    self._queue.get(), timeout=self.timeout
-                )
+                channel = await self._wait_for_channel()
             else:
-                channel = self._queue.get_nowait()
+                raise asyncio.QueueEmpty
 
-        self.active_channels += 1
+        return channel
+
+    async def _wait_for_channel(self):
+        # The released channels are handed over to the waiters directly
+        # (see release()), so they never show up as idle in between.
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
         try:
-            yield channel
-        finally:
-            self.active_channels -= 1
-            self._queue.put_nowait(channel)
+            return await asyncio.wait_for(waiter, timeout=self.timeout)
+        except BaseException:
+            # The channel might get handed over right before we were
+            # cancelled, in that case pass it to the next one in line.
+            if waiter.done() and not waiter.cancelled():
+                self.release(waiter.result())
+            else:
+                with suppress(ValueError):
+                    self._waiters.remove(waiter)
+            raise
+
+    def release(self, channel):
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(channel)
+                return None
+
+        self._idle.append(channel)
+
+    async def _maybe_new_channel(self):
+        channel = await super()._maybe_new_channel()
+        if channel is not None:
+            self._num_channels += 1
+        return channel
 
     async def _cleanup(self):
-        while not self._queue.empty():
-            self._queue.get_nowait()
+        self._num_channels = 0
+        self._idle.clear()
+        while self._waiters:
+            self._waiters.popleft().cancel()
+
+    @property
+    def active_channels(self):
+        return self._num_channels - len(self._idle)
+
+    @property
+    def _open_channels(self):
+        return self._num_channels
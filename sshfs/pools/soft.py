@@ -1,7 +1,6 @@
 import asyncio
 import heapq
-from collections import Counter
-from contextlib import asynccontextmanager
+import itertools
 
 from sshfs.pools.base import BaseSFTPChannelPool
 
@@ -14,25 +13,27 @@ class SFTPSoftChannelPool(BaseSFTPChannelPool):
 
     _THRESHOLD = 4
 
-    # Placeholder to use when there are no channels in
-    # the counter.
-    _NO_CHANNELS = [[None, _THRESHOLD + 1]]
-
     def __init__(self, *args, **kwargs):
-        self._channels = Counter()
+        # A min-heap of [num_connections, order, seq, channel] entries.
+        # Ties are broken by the order the channels were created in, and
+        # the unique sequence number ensures that the channels themselves
+        # are never compared. Entries are never updated in place, each
+        # change pushes a new one and the stale ones get discarded lazily.
+        self._heap = []
+        # Mapping of channels to their live entry on the heap.
+        self._channels = {}
+        self._counter = itertools.count()
         self._channels_lock = asyncio.Lock()
         super().__init__(*args, **kwargs)
 
-    @asynccontextmanager
-    async def get(self):
+    async def acquire(self):
         least_used_channel, num_connections = self._least_used()
         if least_used_channel is None or num_connections >= self._THRESHOLD:
             async with self._channels_lock:
                 channel = await self._maybe_new_channel()
                 if channel is not None:
                     least_used_channel = channel
-                    num_connections = 0
-                    self._channels[least_used_channel] = 0
+                    self._update(least_used_channel, 0)
 
             if channel is None:
                 # another coroutine may have opened a channel while we waited
@@ -41,21 +42,54 @@ class SFTPSoftChannelPool(BaseSFTPChannelPool):
         if least_used_channel is None:
             raise ValueError("Can't create any SFTP connections!")
 
-        self._channels[least_used_channel] += 1
-        try:
-            yield least_used_channel
-        finally:
-            self._channels[least_used_channel] -= 1
+        self._adjust(least_used_channel, 1)
+        return least_used_channel
+
+    def release(self, channel):
+        self._adjust(channel, -1)
 
     async def _cleanup(self):
+        self._heap.clear()
         self._channels.clear()
 
     def _least_used(self):
-        [(least_used_channel, num_connections)] = (
-            heapq.nsmallest(1, self._channels.items(), lambda kv: kv[1])
-            or self._NO_CHANNELS
-        )
-        return least_used_channel, num_connections
+        heap = self._heap
+        while heap:
+            entry = heap[0]
+            num_connections, _, _, channel = entry
+            if self._channels.get(channel) is entry:
+                return channel, num_connections
+            heapq.heappop(heap)
+        return None, None
+
+    def _adjust(self, channel, delta):
+        entry = self._channels.get(channel)
+        # The pool might be cleaned up while the channel is still in use.
+        if entry is not None:
+            self._update(channel, entry[0] + delta)
+
+    def _update(self, channel, num_connections):
+        heap = self._heap
+        old_entry = self._channels.get(channel)
+        if old_entry is None:
+            order = len(self._channels)
+        else:
+            order = old_entry[1]
+
+        seq = next(self._counter)
+        new_entry = [num_connections, order, seq, channel]
+        self._channels[channel] = new_entry
+
+        if heap and heap[0] is old_entry:
+            heapq.heapreplace(heap, new_entry)
+        else:
+            heapq.heappush(heap, new_entry)
+
+        # Stale entries that are buried under the live ones won't be
+        # popped by _least_used(), so rebuild the heap before they pile up.
+        if len(heap) > 2 * len(self._channels) + self._THRESHOLD:
+            self._heap = list(self._channels.values())
+            heapq.heapify(self._heap)
 
     @property
     def active_channels(self):
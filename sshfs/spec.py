@@ -1,5 +1,5 @@
 import asyncio
-import posixpath
+import functools
 import shlex
 import stat
 import weakref
@@ -27,6 +27,31 @@ async_methods.append("_mv")
 _SHELL_CHANNELS = 2
 _DEFAULT_MAX_SESSIONS = 10
 
+_FILE_TYPES = {
+    stat.S_IFDIR: "directory",
+    stat.S_IFREG: "file",
+    stat.S_IFLNK: "link",
+}
+
+
+def _open_options(block_size):
+    # Unless a block size is requested explicitly, let asyncssh pick it.
+    # Recent versions use the limits that the server advertises, which
+    # can be much larger than our fixed READ/WRITE_BLOCK_SIZE.
+    if block_size is None:
+        return {}
+    return {"block_size": block_size}
+
+
+# Entries that readdir() might return which are not actual children.
+_SKIPPED_NAMES = frozenset(["", ".", ".."])
+
+# Entries of the same directory tend to share timestamps, and the
+# datetime objects are immutable so they can be reused across infos.
+_utc_from_timestamp = functools.lru_cache(maxsize=4096)(
+    datetime.utcfromtimestamp
+)
+
 
 class SSHFileSystem(AsyncFileSystem):
     def __init__(
@@ -64,6 +89,7 @@ class SSHFileSystem(AsyncFileSystem):
 
         self._stack = AsyncExitStack()
         self.active_executors = 0
+        self._system = None
         self._client, self._pool = self.connect(
             host,
             pool_type,
@@ -92,6 +118,7 @@ class SSHFileSystem(AsyncFileSystem):
         self, host, pool_type, max_sftp_channels, **client_args
     ):
         self._client_lock = asyncio.Semaphore(_SHELL_CHANNELS)
+        self._system_lock = asyncio.Lock()
 
         _raw_client = asyncssh.connect(host, **client_args)
         client = await self._stack.enter_async_context(_raw_client)
@@ -116,32 +143,62 @@ class SSHFileSystem(AsyncFileSystem):
         return self._client
 
     def _decode_attributes(self, attributes):
-        if stat.S_ISDIR(attributes.permissions):
-            kind = "directory"
-        elif stat.S_ISREG(attributes.permissions):
-            kind = "file"
-        elif stat.S_ISLNK(attributes.permissions):
-            kind = "link"
-        else:
-            kind = "unknown"
-
+        kind = _FILE_TYPES.get(stat.S_IFMT(attributes.permissions), "unknown")
         return {
             "size": attributes.size,
             "type": kind,
             "gid": attributes.gid,
             "uid": attributes.uid,
-            "time": datetime.utcfromtimestamp(attributes.atime),
-            "mtime": datetime.utcfromtimestamp(attributes.mtime),
+            "time": _utc_from_timestamp(attributes.atime),
+            "mtime": _utc_from_timestamp(attributes.mtime),
             "permissions": attributes.permissions,
         }
 
+    def _info_from_cache(self, path):
+        try:
+            listing = self.dircache[self._parent(path)]
+        except KeyError:
+            return None
+
+        for info in listing:
+            # The listings are built from lstat() results, so the links
+            # still need to be resolved through the server.
+            if info["name"] == path and info["type"] != "link":
+                return info.copy()
+        return None
+
+    def invalidate_cache(self, path=None):
+        if path is None:
+            self.dircache.clear()
+            return None
+
+        path = self._strip_protocol(path).rstrip("/")
+        prefix = path + "/"
+        for cached_path in list(self.dircache):
+            if cached_path.startswith(prefix):
+                self.dircache.pop(cached_path, None)
+
+        # The root listing is stored under "", so pop it as well
+        # before giving up on the parents.
+        while True:
+            self.dircache.pop(path, None)
+            parent = self._parent(path)
+            if not path or parent == path:
+                break
+            path = parent
+
     @wrap_exceptions
     async def _info(self, path, **kwargs):
         path = self._strip_protocol(path)
-        async with self._pool.get() as channel:
-            attributes = await channel.stat(path)
+        info = self._info_from_cache(path.rstrip("/"))
+        if info is None:
+            channel = await self._pool.acquire()
+            try:
+                attributes = await channel.stat(path)
+            finally:
+                self._pool.release(channel)
+            info = self._decode_attributes(attributes)
 
-        info = self._decode_attributes(attributes)
         path = path.rstrip("/")
         if info["type"] == "directory":
             path += "/"
@@ -159,7 +216,10 @@ class SSHFileSystem(AsyncFileSystem):
     async def _mv(self, lpath, rpath, **kwargs):
         async with self._pool.get() as channel:
             with suppress(SFTPOpUnsupported):
-                return await channel.posix_rename(lpath, rpath)
+                await channel.posix_rename(lpath, rpath)
+                self.invalidate_cache(lpath)
+                self.invalidate_cache(rpath)
+                return None
 
         # Some systems doesn't natively support posix_rename
         # which is an extension to the original SFTP protocol.
@@ -188,6 +248,7 @@ class SSHFileSystem(AsyncFileSystem):
                 block_size=block_size,
                 progress_handler=as_progress_handler(callback),
             )
+        self.invalidate_cache(rpath)
 
     @wrap_exceptions
     async def _get_file(
@@ -203,23 +264,45 @@ class SSHFileSystem(AsyncFileSystem):
 
     @wrap_exceptions
     async def _cp_file(self, lpath, rpath, **kwargs):
+        async with self._pool.get() as channel:
+            # Servers that implement the copy-data extension can copy
+            # the file on their side without spawning a process. Links
+            # are followed to copy the contents, just like the cp does.
+            if getattr(channel, "supports_remote_copy", False):
+                await channel.copy(
+                    lpath, rpath, follow_symlinks=True, remote_only=True
+                )
+                self.invalidate_cache(rpath)
+                return None
+
         cmd = f"cp {shlex.quote(lpath)} {shlex.quote(rpath)}"
         await self._execute(cmd)
+        self.invalidate_cache(rpath)
 
     @wrap_exceptions
     async def _ls(self, path, detail=False, **kwargs):
-        async with self._pool.get() as channel:
+        channel = await self._pool.acquire()
+        try:
             file_attrs = await channel.readdir(path)
+        finally:
+            self._pool.release(channel)
+
+        # Equivalent of posixpath.join() for the relative file names
+        # that readdir() returns, without doing it for every entry.
+        if path:
+            prefix = path.rstrip("/") + "/"
+        else:
+            prefix = ""
 
         infos = []
         for file_attr in file_attrs:
-            if file_attr.filename in ["", ".", ".."]:
+            if file_attr.filename in _SKIPPED_NAMES:
                 continue
             info = self._decode_attributes(file_attr.attrs)
-            info["name"] = posixpath.join(path, file_attr.filename)
+            info["name"] = prefix + file_attr.filename
             infos.append(info)
 
-        # TODO: listings cache
+        self.dircache[self._strip_protocol(path).rstrip("/")] = infos
         if detail:
             return infos
         else:
@@ -233,24 +316,36 @@ class SSHFileSystem(AsyncFileSystem):
             return await self._makedirs(path, exist_ok=True)
 
         attrs = asyncssh.SFTPAttrs(permissions=permissions)
-        async with self._pool.get() as channel:
+        channel = await self._pool.acquire()
+        try:
             await channel.mkdir(path, attrs=attrs)
+        finally:
+            self._pool.release(channel)
+        self.invalidate_cache(path)
 
     @wrap_exceptions
     async def _makedirs(
         self, path, *, exist_ok=False, permissions=511, **kwargs
     ):
         attrs = asyncssh.SFTPAttrs(permissions=permissions)
-        async with self._pool.get() as channel:
+        channel = await self._pool.acquire()
+        try:
             await channel.makedirs(path, exist_ok=exist_ok, attrs=attrs)
+        finally:
+            self._pool.release(channel)
+        self.invalidate_cache(path)
 
     mkdir = sync_wrapper(_mkdir)
     makedirs = sync_wrapper(_makedirs)
 
     @wrap_exceptions
     async def _rm_file(self, path, **kwargs):
-        async with self._pool.get() as channel:
+        channel = await self._pool.acquire()
+        try:
             await channel.unlink(path)
+        finally:
+            self._pool.release(channel)
+        self.invalidate_cache(path)
 
     @wrap_exceptions
     async def _rmdir(
@@ -261,28 +356,35 @@ class SSHFileSystem(AsyncFileSystem):
         on_error=None,
         **kwargs,
     ):
-        async with self._pool.get() as channel:
+        channel = await self._pool.acquire()
+        try:
             if recursive:
                 await channel.rmtree(
                     path, ignore_errors=ignore_errors, onerror=on_error
                 )
             else:
                 await channel.rmdir(path)
+        finally:
+            self._pool.release(channel)
+        self.invalidate_cache(path)
 
     async def _rm(self, path, recursive=False, **kwargs):
         if isinstance(path, str):
             path = [path]
 
-        coros = []
-        for sub_path in path:
-            if await self._isdir(sub_path):
-                coro = self._rmdir(sub_path, recursive, **kwargs)
-            else:
-                coro = self._rm_file(sub_path)
-            coros.append(coro)
-
+        coros = [
+            self._rm_path(sub_path, recursive, **kwargs) for sub_path in path
+        ]
         await asyncio.gather(*coros)
 
+    async def _rm_path(self, path, recursive=False, **kwargs):
+        # Resolving the type is a round-trip by itself, so it is done
+        # as part of each task rather than sequentially before the gather.
+        if await self._isdir(path):
+            await self._rmdir(path, recursive, **kwargs)
+        else:
+            await self._rm_file(path)
+
     @wrap_exceptions
     async def _checksum(self, path):
         system = await self._get_system()
@@ -307,8 +409,13 @@ class SSHFileSystem(AsyncFileSystem):
 
     @wrap_exceptions
     async def _get_system(self):
-        result = await self._execute("uname")
-        return result.stdout.strip()
+        # The remote system can't change during the lifetime of
+        # the connection, so it is resolved only once.
+        async with self._system_lock:
+            if self._system is None:
+                result = await self._execute("uname")
+                self._system = result.stdout.strip()
+        return self._system
 
     checksum = sync_wrapper(_checksum)
     get_system = sync_wrapper(_get_system)
@@ -326,19 +433,57 @@ class SSHFileSystem(AsyncFileSystem):
         return SSHFile(self, path, *args, **kwargs)
 
     @wrap_exceptions
-    async def _cat_file(self, path, **kwargs):
-        """Asynchronously fetch the contents of a file"""
+    async def _cat_file(
+        self,
+        path,
+        start=None,
+        end=None,
+        block_size=None,
+        **kwargs,
+    ):
+        """Asynchronously fetch the contents of a file (or the
+        ``[start, end)`` range of it)"""
+        options = _open_options(block_size)
         async with self._pool.get() as channel:
-            async with channel.open(path, "rb") as f:
-                return await f.read()
+            async with channel.open(path, "rb", **options) as f:
+                if start is None and end is None:
+                    return await f.read()
+
+                start = start or 0
+                if start < 0 or end is None or end < 0:
+                    # asyncssh can't read till the end once the offset
+                    # is past it, so always resolve an open-ended range.
+                    size = (await f.stat()).size
+                    if start < 0:
+                        start = max(0, size + start)
+                    if end is None:
+                        end = size
+                    elif end < 0:
+                        end = size + end
+
+                if end <= start:
+                    return b""
+
+                # A single large read is split by asyncssh into
+                # parallel requests, so avoid chunking it ourselves.
+                await f.seek(start)
+                return await f.read(end - start)
 
     @wrap_exceptions
-    async def _pipe_file(self, path, data, chunksize=50 * 2**20, **kwargs):
+    async def _pipe_file(
+        self,
+        path,
+        data,
+        chunksize=50 * 2**20,
+        block_size=None,
+        **kwargs,
+    ):
         """Asynchronously writes the given data to a remote file in chunks."""
         await self._makedirs(self._parent(path), exist_ok=True)
 
+        options = _open_options(block_size)
         async with self._pool.get() as channel:
-            async with channel.open(path, "wb") as f:
+            async with channel.open(path, "wb", **options) as f:
                 for i in range(0, len(data), chunksize):
                     chunk = data[i : i + chunksize]
                     await f.write(chunk)
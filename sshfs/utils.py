@@ -4,7 +4,7 @@ import os
 
 from asyncssh import ProcessError
 from asyncssh.misc import PermissionDenied
-from asyncssh.sftp import SFTPFailure, SFTPNoSuchFile
+from asyncssh.sftp import SFTPFailure, SFTPFileAlreadyExists, SFTPNoSuchFile
 from fsspec.asyn import sync_wrapper
 
 _NOT_FOUND = os.strerror(errno.ENOENT)
@@ -29,12 +29,16 @@ def wrap_exceptions(func):
             raise PermissionError(exc.reason) from exc
         except SFTPNoSuchFile as exc:
             raise FileNotFoundError(errno.ENOENT, _NOT_FOUND) from exc
+        except SFTPFileAlreadyExists as exc:
+            raise FileExistsError(errno.EEXIST, _FILE_EXISTS) from exc
         except ProcessError as exc:
             message = exc.stderr.strip()
             if message.endswith(_NOT_FOUND):
                 raise FileNotFoundError(errno.ENOENT, _NOT_FOUND) from exc
             raise
         except SFTPFailure as exc:
+            # SFTP servers below version 6 don't have a dedicated
+            # error code, so the reason is the only hint.
             message = exc.reason
             if message.endswith("already exists"):
                 raise FileExistsError(errno.EEXIST, _FILE_EXISTS) from exc
@@ -38,11 +38,15 @@ class FakeSSHClient:
     def __init__(self, max_channels=None):
         self.counter = 0
         self.max_channels = max_channels
+        self.delay = 0
 
     @asynccontextmanager
     async def start_sftp_client(self):
         from asyncssh.misc import ChannelOpenError
 
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
         if self.max_channels is not None and self.counter >= self.max_channels:
             raise ChannelOpenError(None, None)
 
@@ -148,3 +152,103 @@ async def test_pool_soft_queue_balancing(fake_client):
             async with pool.get() as channel_4:
                 assert channel_4.no == 4
             assert channel_3.no == 3
+
+
+@pytest.mark.asyncio
+async def test_pool_soft_queue_heap_bounded(fake_client):
+    pool = SFTPSoftChannelPool(fake_client, max_channels=4)
+
+    async with open_channels(pool, 16):
+        for _ in range(64):
+            async with open_channels(pool, 3):
+                pass
+
+        assert len(pool._heap) <= 2 * pool.active_channels + pool._THRESHOLD
+
+    assert pool._least_used()[1] == 0
+
+
+@pytest.mark.asyncio
+@all_queues
+async def test_pool_acquire_release(fake_client, queue_type):
+    pool = queue_type(fake_client, poll=False, max_channels=1)
+
+    channel = await pool.acquire()
+    assert channel.no == 1
+    assert pool.active_channels == 1
+    pool.release(channel)
+
+    async with pool.get() as channel:
+        assert channel.no == 1
+
+    assert fake_client.counter == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_hard_queue_handover(fake_client):
+    pool = SFTPHardChannelPool(fake_client, max_channels=1)
+    channel = await pool.acquire()
+
+    waiter = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0)
+    assert len(pool._waiters) == 1
+
+    pool.release(channel)
+    assert await asyncio.wait_for(waiter, timeout=1) is channel
+    assert pool.active_channels == 1
+    assert not pool._idle
+    assert not pool._waiters
+
+
+@pytest.mark.asyncio
+async def test_pool_hard_queue_timeout(fake_client):
+    pool = SFTPHardChannelPool(fake_client, max_channels=1, timeout=0.01)
+    channel = await pool.acquire()
+
+    with pytest.raises(asyncio.TimeoutError):
+        await pool.acquire()
+    assert not pool._waiters
+
+    pool.release(channel)
+    assert await pool.acquire() is channel
+
+
+@pytest.mark.asyncio
+async def test_pool_hard_queue_cancel_after_handover(fake_client):
+    pool = SFTPHardChannelPool(fake_client, max_channels=1)
+    channel = await pool.acquire()
+
+    first = asyncio.create_task(pool.acquire())
+    second = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0)
+
+    pool.release(channel)
+    first.cancel()
+    [result] = await asyncio.gather(first, return_exceptions=True)
+    if result is channel:
+        # Depending on the Python version, wait_for() might still
+        # return the result after getting cancelled.
+        pool.release(result)
+
+    assert await asyncio.wait_for(second, timeout=1) is channel
+    assert not pool._waiters
+    assert pool.active_channels == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("num_channels", [1, 2])
+async def test_pool_hard_queue_release_during_open(fake_client, num_channels):
+    pool = SFTPHardChannelPool(fake_client, timeout=0.5)
+    channels = [await pool.acquire() for _ in range(num_channels)]
+
+    # The next channel can't be opened, but one gets released while
+    # the pool is still waiting for the server to reject it.
+    fake_client.max_channels = num_channels
+    fake_client.delay = 0.01
+    waiter = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0)
+    pool.release(channels[0])
+
+    assert await waiter is channels[0]
+    assert pool.max_channels == num_channels
+    assert not pool._waiters
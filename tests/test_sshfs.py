@@ -1,6 +1,8 @@
 import hashlib
+import os
 import posixpath
 import secrets
+import shutil
 import tempfile
 import warnings
 from concurrent import futures
@@ -144,6 +146,31 @@ def test_copy(fs, remote_dir):
     assert strip_keys(initial_info) == strip_keys(secondary_info)
 
 
+def test_copy_remote(fs, remote_dir, monkeypatch):
+    from asyncssh import SFTPClient
+
+    # The test server doesn't advertise copy-data, so pretend it does
+    # and copy on the server side (the same machine) ourselves.
+    calls = []
+
+    async def copy(self, srcpath, dstpath, **kwargs):
+        calls.append(kwargs)
+        shutil.copyfile(
+            srcpath, dstpath, follow_symlinks=kwargs["follow_symlinks"]
+        )
+
+    monkeypatch.setattr(SFTPClient, "supports_remote_copy", True)
+    monkeypatch.setattr(SFTPClient, "copy", copy)
+
+    fs.pipe_file(remote_dir + "/a.txt", b"data")
+    os.symlink("a.txt", remote_dir + "/link")
+
+    fs.copy(remote_dir + "/link", remote_dir + "/b.txt")
+    assert calls == [{"follow_symlinks": True, "remote_only": True}]
+    assert not os.path.islink(remote_dir + "/b.txt")
+    assert fs.cat_file(remote_dir + "/b.txt") == b"data"
+
+
 def test_rm(fs, remote_dir):
     fs.touch(remote_dir + "/a.txt")
     fs.rm(remote_dir + "/a.txt")
@@ -192,6 +219,45 @@ def test_ls(fs, remote_dir):
     assert dirs == expected
 
 
+def test_ls_cache(fs, remote_dir):
+    fs.mkdir(remote_dir + "/dir")
+    fs.touch(remote_dir + "/dir/a.txt")
+    fs.ls(remote_dir + "/dir")
+    assert remote_dir + "/dir" in fs.dircache
+
+    details = fs.info(remote_dir + "/dir/a.txt")
+    assert details["name"] == remote_dir + "/dir/a.txt"
+
+    fs.pipe_file(remote_dir + "/dir/a.txt", b"data")
+    assert remote_dir + "/dir" not in fs.dircache
+    assert fs.info(remote_dir + "/dir/a.txt")["size"] == 4
+
+    fs.ls(remote_dir + "/dir")
+    fs.rm(remote_dir + "/dir/a.txt")
+    assert not fs.exists(remote_dir + "/dir/a.txt")
+    assert fs.ls(remote_dir + "/dir") == []
+
+
+def test_ls_cache_root(fs, remote_dir):
+    # remote_dir lives under the temporary directory, so walk the
+    # listings all the way up from the root.
+    fs.touch(remote_dir + "/a.txt")
+    parts = remote_dir.strip("/").split("/")
+    for depth in range(len(parts) + 1):
+        fs.ls("/" + "/".join(parts[:depth]))
+    assert "" in fs.dircache
+
+    fs.invalidate_cache(remote_dir + "/a.txt")
+    assert "" not in fs.dircache
+    assert remote_dir not in fs.dircache
+
+    fs.ls("/")
+    fs.ls(remote_dir)
+    fs.rm(remote_dir + "/a.txt")
+    assert "" not in fs.dircache
+    assert not fs.exists(remote_dir + "/a.txt")
+
+
 def test_mkdir(fs, remote_dir):
     fs.mkdir(remote_dir + "dir/")
     assert fs.isdir(remote_dir + "dir/")
@@ -372,3 +438,28 @@ def test_pipe_file(fs, remote_dir):
         assert (
             f.read() == test_data
         ), "The data read from the file does not match the data written."
+
+
+def test_get_system(fs):
+    system = fs.get_system()
+    assert system
+    assert fs._system == system
+    assert fs.get_system() == system
+
+
+def test_cat_file_range(fs, remote_dir):
+    test_data = b"0123456789" * 2**10
+    test_file_path = remote_dir + "/test_cat_file_range.txt"
+    fs.pipe_file(test_file_path, test_data)
+
+    assert fs.cat_file(test_file_path, start=10) == test_data[10:]
+    assert fs.cat_file(test_file_path, end=15) == test_data[:15]
+    assert (
+        fs.cat_file(test_file_path, start=5, end=2**12) == test_data[5:4096]
+    )
+    assert fs.cat_file(test_file_path, start=-8) == test_data[-8:]
+    assert fs.cat_file(test_file_path, start=-8, end=-2) == test_data[-8:-2]
+    assert fs.cat_file(test_file_path, start=20, end=10) == b""
+    assert fs.cat_file(test_file_path, start=2**14) == b""
+    assert fs.cat_file(test_file_path, start=2**14, end=2**15) == b""
+    assert fs.cat_file(test_file_path, start=-(2**14)) == test_data